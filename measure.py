@@ -1,22 +1,29 @@
 #!/usr/bin/env python3
+import argparse
+import concurrent.futures
+import io
+import multiprocessing
 import os
 import subprocess
+import math
 import time
-import statistics
 import sys
+from array import array
 from shutil import which
-import concurrent.futures
-import threading
 
 """
 measure.py
 
 Measure copy times for three programs (./unixcopy, ./unixcopy-stdlib, cp)
 over several source files and buffer sizes. Produces simple text tables
-(grouped by buffer size) with 20 measurements each.
+(grouped by buffer size) with up to 20 measurements each.
 
 Usage: run from the repository root where source files and ./unixcopy exist:
-  python3 measure.py
+  python3 measure.py [--cache {warm,cold,both}]
+
+--cache selects the page cache state of the source before each run: warm
+(read into the cache beforehand, the default), cold (evicted before every
+run) or both (two series per cell).
 """
 
 
@@ -26,6 +33,15 @@ FILES = ["file-1B.bin", "file-100MB.bin", "file-1GB.bin"]
 BUFFERS = [1, 512, 1024]        # bytes to pass as -b to unixcopy variants
 MEASUREMENTS = 20
 TMP_DIR = "/tmp"
+MIN_MEASUREMENTS = 5            # valid runs before a cell may stop early (3 left after trimming)
+CONVERGED_CV = 0.01             # stop once stdev/mean of a cell drops below this
+CELL_BUDGET_SEC = 60.0          # stop once the remaining runs would exceed this
+
+parser = argparse.ArgumentParser(description="Measure copy times of unixcopy, unixcopy-stdlib and cp.")
+parser.add_argument("--cache", choices=("warm", "cold", "both"), default="warm",
+                    help="page cache state of the source file before each run (default: warm)")
+args = parser.parse_args()
+CACHE_MODES = ["warm", "cold"] if args.cache == "both" else [args.cache]
 
 # Verify sources and programs
 missing = [f for f in FILES if not os.path.exists(f)]
@@ -38,64 +54,318 @@ if which("cp") is None:
   print("cp command not found on PATH", file=sys.stderr)
   sys.exit(1)
 
-# Data structure: results[buffer][program][file] = list of floats (seconds)
-results = {b: {p: {f: [] for f in FILES} for p in PROGRAMS} for b in BUFFERS}
+# Optional CPU pinning: MEASURE_PIN_CPU=N runs every measured copy on CPU N
+# and keeps this script off it, so the scheduler does not migrate the copy
+# between cores (and flush its caches) mid-run.
+PIN_CPU = os.environ.get("MEASURE_PIN_CPU")
+if PIN_CPU is not None:
+  allowed_cpus = os.sched_getaffinity(0)
+  try:
+    PIN_CPU = int(PIN_CPU)
+  except ValueError:
+    PIN_CPU = -1
+  if PIN_CPU not in allowed_cpus:
+    print(f"MEASURE_PIN_CPU must be one of: {sorted(allowed_cpus)}", file=sys.stderr)
+    sys.exit(1)
+  # CPUs this script runs on between spawns
+  PARENT_CPUS = allowed_cpus - {PIN_CPU} if len(allowed_cpus) > 1 else allowed_cpus
+  os.sched_setaffinity(0, PARENT_CPUS)
+  # Raise our own priority once; spawned copies and drivers inherit the nice
+  # value, so nothing has to be done per spawn. Needs CAP_SYS_NICE; run at
+  # normal priority without it.
+  try:
+    os.setpriority(os.PRIO_PROCESS, 0, -10)
+  except PermissionError:
+    pass
+
+# Optional stress mode: MEASURE_CONTENTION_JOBS=N runs all measurements of a
+# cell at once on N worker processes, each pinned to its own CPU, to time the
+# copies under contention. The default (unset) is the clean serial run.
+CONTENTION_JOBS = os.environ.get("MEASURE_CONTENTION_JOBS")
+if CONTENTION_JOBS is not None:
+  try:
+    CONTENTION_JOBS = int(CONTENTION_JOBS)
+  except ValueError:
+    CONTENTION_JOBS = 0
+  if CONTENTION_JOBS < 1:
+    print("MEASURE_CONTENTION_JOBS must be a positive integer", file=sys.stderr)
+    sys.exit(1)
+  if PIN_CPU is not None:
+    print("MEASURE_CONTENTION_JOBS cannot be combined with MEASURE_PIN_CPU", file=sys.stderr)
+    sys.exit(1)
+  # Concurrent runs read the same source, so all but the first would hit the
+  # pages it just read; a cold series cannot be measured this way
+  if "cold" in CACHE_MODES:
+    print("MEASURE_CONTENTION_JOBS only supports --cache warm", file=sys.stderr)
+    sys.exit(1)
+
+# Data structure: results[metric] is one flat, contiguous array of int64 laid
+# out as [cache][buffer][program][file][run], where metric is "wall"
+# (elapsed), "cpu" (child user+sys time), "user" or "sys" (all nanoseconds).
+# Times stay integers until they are printed. valid[k] is 1 once run k was
+# measured successfully; runs that failed or were skipped stay 0.
+# _cell() gives the offset of a (cache, buffer, program, file) series' first run.
+METRICS = ("wall", "cpu", "user", "sys")
+RESULTS_SIZE = len(CACHE_MODES) * len(BUFFERS) * len(PROGRAMS) * len(FILES) * MEASUREMENTS
+results = {m: array("q", [0]) * RESULTS_SIZE for m in METRICS}
+valid = bytearray(RESULTS_SIZE)
+
+def _cell(ci, bi, pi, fi):
+  return (((ci * len(BUFFERS) + bi) * len(PROGRAMS) + pi) * len(FILES) + fi) * MEASUREMENTS
+
+# Destination path prefix per (program, source), built once so the
+# measurement loop does no basename/replace string work
+DST_PREFIX = {
+  (p, f): os.path.join(TMP_DIR, f"{os.path.basename(f)}.{p.replace('./', '').replace('/', '_')}")
+  for p in PROGRAMS for f in FILES
+}
+
+# Every run of a (program, file, buffer) cell reuses one destination path,
+# so /tmp never holds more than one copy and the runs share inode churn
+def _make_dst(src, prog, b):
+  return f"{DST_PREFIX[(prog, src)]}.b{b}"
 
-def _make_dst(src, prog, b, run_index):
-  base = os.path.basename(src)
-  prog_tag = prog.replace("./", "").replace("/", "_")
-  return os.path.join(TMP_DIR, f"{base}.{prog_tag}.b{b}.run{run_index}")
+def _remove_dst(dst):
+  # A single unlink, no exists() stat beforehand
+  try:
+    os.unlink(dst)
+  except FileNotFoundError:
+    pass
+
+# /dev/null is opened once and dup'ed onto the child's stdout/stderr
+DEVNULL_FD = os.open(os.devnull, os.O_WRONLY)
+SPAWN_FILE_ACTIONS = [
+  (os.POSIX_SPAWN_DUP2, DEVNULL_FD, 1),
+  (os.POSIX_SPAWN_DUP2, DEVNULL_FD, 2),
+]
+
+def _enter_pin_cpu():
+  # Move this script onto PIN_CPU right before a spawn: the child inherits
+  # the affinity, so it is pinned from its first instruction (a 1B copy may
+  # be done before we could pin it from outside). _leave_pin_cpu() moves
+  # the script back off it.
+  if PIN_CPU is not None:
+    os.sched_setaffinity(0, {PIN_CPU})
+
+def _leave_pin_cpu():
+  if PIN_CPU is not None:
+    os.sched_setaffinity(0, PARENT_CPUS)
 
 def _run_command(cmd):
-  start = time.perf_counter()
-  subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-  end = time.perf_counter()
-  return end - start
+  # posix_spawn avoids fork()'s page table copy of this interpreter, which
+  # otherwise dominates the timing of tiny copies.
+  # CLOCK_MONOTONIC_RAW is not slewed by NTP, and wait4's rusage gives the
+  # child's own CPU time. Its ru_maxrss is not usable: the spawned child
+  # shares (and keeps) this interpreter's RSS high-water mark, so it is not
+  # recorded. Returns values in METRICS order.
+  # The script stays on PIN_CPU until the child is reaped, which keeps the
+  # affinity syscalls out of the timed window; it only sleeps in wait4.
+  _enter_pin_cpu()
+  try:
+    start = time.clock_gettime_ns(time.CLOCK_MONOTONIC_RAW)
+    pid = os.posix_spawnp(cmd[0], cmd, os.environ, file_actions=SPAWN_FILE_ACTIONS)
+    _, status, rusage = os.wait4(pid, 0)
+    end = time.clock_gettime_ns(time.CLOCK_MONOTONIC_RAW)
+  finally:
+    _leave_pin_cpu()
+  code = os.waitstatus_to_exitcode(status)
+  if code != 0:
+    raise subprocess.CalledProcessError(code, cmd)
+  # rusage times are whole microseconds carried in a float
+  user = round(rusage.ru_utime * 1_000_000) * 1000
+  sys_ = round(rusage.ru_stime * 1_000_000) * 1000
+  return end - start, user + sys_, user, sys_
+
+def _drop_src_cache(src):
+  # Ask the kernel to evict src from the page cache so the next read is cold
+  fd = os.open(src, os.O_RDONLY)
+  try:
+    os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+  finally:
+    os.close(fd)
+
+def _warm_src_cache(src):
+  # Read src once (like cat src > /dev/null) so every run finds it cached
+  with open(src, "rb", buffering=0) as f:
+    while f.read(1 << 20):
+      pass
+
+def _series_metric(b, prog):
+  # A 1-byte buffer makes the unixcopy variants spend their time in
+  # read/write syscall overhead (CPU bound); everything else waits on I/O.
+  if b == 1 and prog in ("./unixcopy", "./unixcopy-stdlib"):
+    return "cpu"
+  return "wall"
 
-print("Starting measurements (multithreaded)...")
+print("Starting measurements...")
 
-# Worker: run one copy and return (buffer, program, file, run_index, time_sec)
-def _measure_task(b, prog, src, i):
-  dst = _make_dst(src, prog, b, i)
-  # Build command
+def _make_cmd(b, prog, src, dst):
   if prog in ("./unixcopy", "./unixcopy-stdlib"):
-    cmd = [prog, "-b", str(b), src, dst]
-  else:  # cp
-    cmd = ["cp", src, dst]
+    return [prog, "-b", str(b), src, dst]
+  return ["cp", src, dst]
+
+# Long-lived benchmark drivers ("prog --bench") for the unixcopy variants:
+# one process per program performs all of its copies, so a run no longer
+# pays for a spawn. drivers maps program -> Popen; programs built without
+# --bench (and cp) are spawned once per run instead. A driver that dies is
+# dropped and its program is spawned per run from then on (lost_drivers).
+drivers = {}
+lost_drivers = set()
+
+def _close_driver(proc):
+  # A dead driver leaves our unsent job in the pipe buffer; closing then
+  # fails to flush it, which must not cost us the results
+  try:
+    proc.stdin.close()
+  except BrokenPipeError:
+    pass
+  proc.wait()
+
+def _start_driver(prog):
+  _enter_pin_cpu()
   try:
-    t = _run_command(cmd)
-  except subprocess.CalledProcessError:
-    t = float("nan")
+    proc = subprocess.Popen([prog, "--bench"], stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                            stderr=subprocess.DEVNULL, text=True)
+  except OSError:
+    return None
   finally:
-    # Cleanup: remove dst if exists
-    try:
-      if os.path.exists(dst):
-        os.remove(dst)
-    except Exception:
-      pass
-  return (b, prog, src, i, t)
-
-# Submit tasks in parallel and collect results as they finish
-max_workers = min(32, (os.cpu_count() or 1) * 4)
-futures = []
-lock = threading.Lock()
-with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as ex:
-  for b in BUFFERS:
-    for prog in PROGRAMS:
-      for src in FILES:
-        for i in range(MEASUREMENTS):
-          futures.append(ex.submit(_measure_task, b, prog, src, i))
-
-  # As futures complete, append to results
-  for fut in concurrent.futures.as_completed(futures):
-    try:
-      b, prog, src, i, t = fut.result()
-    except Exception:
-      # Shouldn't happen, but record a nan if it does
+    _leave_pin_cpu()
+  # A driver announces itself; an older binary just prints usage and exits
+  if proc.stdout.readline() != "ready\n":
+    _close_driver(proc)
+    return None
+  return proc
+
+def _run_bench(proc, cmd):
+  # cmd is [prog, "-b", buf, src, dst] as built by _make_cmd. The driver
+  # times the copy itself on CLOCK_MONOTONIC_RAW and reports its own CPU
+  # time for it. Returns values in METRICS order.
+  try:
+    proc.stdin.write(f"{cmd[3]}\t{cmd[4]}\t{cmd[2]}\n")
+    proc.stdin.flush()
+    line = proc.stdout.readline()
+  except BrokenPipeError:
+    line = ""
+  if not line:
+    # The driver died: drop it and spawn this and all later runs instead
+    del drivers[cmd[0]]
+    lost_drivers.add(cmd[0])
+    _close_driver(proc)
+    return _run_command(cmd)
+  reply = line.split()
+  if len(reply) != 4:  # "error"
+    raise subprocess.CalledProcessError(1, cmd)
+  start_ns, end_ns, user_ns, sys_ns = map(int, reply)
+  return end_ns - start_ns, user_ns + sys_ns, user_ns, sys_ns
+
+# Run one copy and return its METRICS (None if the program failed, or could
+# not be started at all, e.g. a missing or non-executable ./unixcopy)
+def _measure_task(cmd):
+  try:
+    proc = drivers.get(cmd[0])
+    if proc is not None:
+      return _run_bench(proc, cmd)
+    return _run_command(cmd)
+  except (subprocess.CalledProcessError, OSError):
+    return None
+
+def _pin_worker(cpus):
+  # Pool initializer: pin each worker to its own CPU. Worker identities are
+  # 1-based and unique within the pool.
+  index = multiprocessing.current_process()._identity[0] - 1
+  os.sched_setaffinity(0, {cpus[index % len(cpus)]})
+
+def _contended_task(cmd):
+  # Runs in a pool worker; every concurrent run writes its own destination
+  try:
+    return _measure_task(cmd)
+  finally:
+    _remove_dst(cmd[-1])
+
+# By default run everything serially: concurrent copies fight over the page
+# cache and the I/O queue, which skews exactly the timings we are trying to
+# take. Processes rather than threads are used for the stress mode so each
+# worker can be pinned to a CPU; fork keeps workers from re-running this
+# script on import.
+pool = None
+if CONTENTION_JOBS:
+  cpus = sorted(os.sched_getaffinity(0))
+  pool = concurrent.futures.ProcessPoolExecutor(
+    max_workers=CONTENTION_JOBS,
+    mp_context=multiprocessing.get_context("fork"),
+    initializer=_pin_worker,
+    initargs=(cpus,),
+  )
+else:
+  # Drivers are only used serially; forked pool workers would share their pipes
+  for prog in PROGRAMS:
+    if prog in ("./unixcopy", "./unixcopy-stdlib"):
+      proc = _start_driver(prog)
+      if proc is not None:
+        drivers[prog] = proc
+
+def _store_run(k, values):
+  for m, v in zip(METRICS, values):
+    results[m][k] = v
+  valid[k] = 1
+
+def _measure_series(cmd, src, dst, cell, metric, cold):
+  # Fill one series of runs starting at results offset `cell`.
+  # Running mean / sum of squared deviations (Welford) of the metric the
+  # stats are computed on, so a series can stop as soon as more runs add
+  # nothing (e.g. 1GiB with a 1B buffer takes minutes per run).
+  # Runs that are skipped stay invalid in results.
+  n, run_mean, m2 = 0, 0.0, 0.0
+  # Untimed warmup run primes the program's pages (and the page cache)
+  _measure_task(cmd)
+  if not cold:
+    _warm_src_cache(src)
+  if pool is not None:
+    _remove_dst(dst)
+    cmds = [cmd[:-1] + [f"{dst}.run{i}"] for i in range(MEASUREMENTS)]
+    for i, values in enumerate(pool.map(_contended_task, cmds)):
+      if values is not None:
+        _store_run(cell + i, values)
+    return
+  for i in range(MEASUREMENTS):
+    # Drop the previous run's copy, then flush dirty pages so they are
+    # not written back in the middle of this run
+    _remove_dst(dst)
+    os.sync()
+    if cold:
+      _drop_src_cache(src)
+    values = _measure_task(cmd)
+    if values is None:
+      continue
+    _store_run(cell + i, values)
+    t = values[METRICS.index(metric)]
+    n += 1
+    delta = t - run_mean
+    run_mean += delta / n
+    m2 += delta * (t - run_mean)
+    if n < MIN_MEASUREMENTS or run_mean <= 0:
       continue
-    # Append into results (list append is thread-safe in CPython, but use lock for clarity)
-    with lock:
-      results[b][prog][src].append(t)
+    stdev = math.sqrt(m2 / n)
+    if stdev / run_mean < CONVERGED_CV:
+      break
+    if run_mean * (MEASUREMENTS - i - 1) > CELL_BUDGET_SEC * 1_000_000_000:
+      break
+  _remove_dst(dst)
+
+for bi, b in enumerate(BUFFERS):
+  for pi, prog in enumerate(PROGRAMS):
+    for fi, src in enumerate(FILES):
+      metric = _series_metric(b, prog)
+      dst = _make_dst(src, prog, b)
+      # The destination is fixed per cell, so the argv is built once, not per run
+      cmd = _make_cmd(b, prog, src, dst)
+      for ci, cache in enumerate(CACHE_MODES):
+        _measure_series(cmd, src, dst, _cell(ci, bi, pi, fi), metric, cache == "cold")
+
+if pool is not None:
+  pool.shutdown()
+for proc in drivers.values():
+  _close_driver(proc)
 
 # Print results grouped by buffer size
 def _human_file_label(filename):
@@ -117,10 +387,21 @@ def _prog_label(prog):
     return "cp komanda"
   return prog
 
+def _timing_label(prog):
+  # Driver runs are timed inside the program and exclude spawn/exec; spawned
+  # runs include it. Rows timed differently are not directly comparable.
+  if prog in lost_drivers:
+    return "--bench driver died mid-run, later runs timed around spawn; mixed"
+  if prog in drivers:
+    return "timed in --bench driver, excludes spawn/exec"
+  return "timed around spawn, includes spawn/exec"
+
 def _format_series(vals):
-  # vals: list of floats, may contain nan. Remove nan's for calculations.
-  valid = [v for v in vals if v == v]
-  if not valid:
+  # vals: list of int nanoseconds, None for runs without a measurement.
+  # Stats are computed exactly on the integers and returned in seconds
+  # (nan where a statistic is not available).
+  measured = [v for v in vals if v is not None]
+  if not measured:
     return {
       "excluded_min": float("nan"),
       "excluded_max": float("nan"),
@@ -130,9 +411,10 @@ def _format_series(vals):
       "delta_plus": float("nan"),
       "delta_minus": float("nan"),
     }
+  # Sort once; every statistic below is read off the sorted list
+  sorted_vals = sorted(measured)
   # If at least 3 values, remove one global min and one global max as "izbačeni"
-  if len(valid) >= 3:
-    sorted_vals = sorted(valid)
+  if len(sorted_vals) >= 3:
     excluded_min = sorted_vals[0]
     excluded_max = sorted_vals[-1]
     remaining = sorted_vals[1:-1]
@@ -140,11 +422,12 @@ def _format_series(vals):
     # Not enough values to exclude, treat excluded as nan and compute on all
     excluded_min = float("nan")
     excluded_max = float("nan")
-    remaining = valid
+    remaining = sorted_vals
   if remaining:
-    mean = statistics.mean(remaining)
-    rem_min = min(remaining)
-    rem_max = max(remaining)
+    # Integer sum is exact; the only rounding is the final division
+    mean = sum(remaining) / len(remaining)
+    rem_min = remaining[0]
+    rem_max = remaining[-1]
     delta_plus = rem_max - mean
     delta_minus = mean - rem_min
   else:
@@ -154,65 +437,83 @@ def _format_series(vals):
     delta_plus = float("nan")
     delta_minus = float("nan")
   return {
-    "excluded_min": excluded_min,
-    "excluded_max": excluded_max,
-    "mean": mean,
-    "rem_min": rem_min,
-    "rem_max": rem_max,
-    "delta_plus": delta_plus,
-    "delta_minus": delta_minus,
+    "excluded_min": excluded_min / 1e9,
+    "excluded_max": excluded_max / 1e9,
+    "mean": mean / 1e9,
+    "rem_min": rem_min / 1e9,
+    "rem_max": rem_max / 1e9,
+    "delta_plus": delta_plus / 1e9,
+    "delta_minus": delta_minus / 1e9,
   }
 
 def _format_python_list(vals):
-  # Return a string that is a valid Python list literal.
+  # Return a string that is a valid Python list literal of seconds.
   parts = []
   for v in vals:
-    if v != v:  # nan
+    if v is None:
       parts.append("float('nan')")
     else:
       # Use 6 decimals for compactness
-      parts.append(f"{v:.6f}")
+      parts.append(f"{v / 1e9:.6f}")
   return "[" + ", ".join(parts) + "]"
 
-for b in BUFFERS:
-  print("\n" + "="*80)
-  print(f"Buffer size: {b}B")
-  print("="*80)
-  for prog in PROGRAMS:
-    print(f"\n{_prog_label(prog)}: ")
-    for src in FILES:
+# Build the whole report in memory and write it out once at the end, so the
+# report does not issue a stdout write (and terminal flush) per line
+out = io.StringIO()
+if len({_timing_label(p) for p in PROGRAMS}) > 1:
+  print("\nNote: programs are timed by different methods (see the label after each", file=out)
+  print("program name); only compare rows timed the same way.", file=out)
+for bi, b in enumerate(BUFFERS):
+  print("\n" + "="*80, file=out)
+  print(f"Buffer size: {b}B", file=out)
+  print("="*80, file=out)
+  for pi, prog in enumerate(PROGRAMS):
+    print(f"\n{_prog_label(prog)} ({_timing_label(prog)}): ", file=out)
+    for fi, src in enumerate(FILES):
       label = _human_file_label(src)
-      series = results[b][prog][src]
-      stats = _format_series(series)
-      ex_min = stats["excluded_min"]
-      ex_max = stats["excluded_max"]
-      mean = stats["mean"]
-      rem_min = stats["rem_min"]
-      rem_max = stats["rem_max"]
-      dp = stats["delta_plus"]
-      dm = stats["delta_minus"]
-      # Print the raw runs as a Python list literal
-      print("")
-      print(f"runs: {_format_python_list(series)}")
-      print("")
-      print(f"{label}:")
-      if ex_min == ex_min and ex_max == ex_max:
-        print(f"Izbačeni brojevi: min - {ex_min:.6f}s, max - {ex_max:.6f}s")
-      else:
-        print(f"Izbačeni brojevi: min - nan, max - nan")
-      if mean == mean:
-        # mean: show 7 decimals if possible
-        print(f"Aritmetička sredina: {mean:.7f}s")
-      else:
-        print("Aritmetička sredina: nan")
-      print("Maksimalne devijacije:")
-      if dp == dp and dm == dm:
-        # Show the subtraction expressions similar to sample
-        print(f"Δ+ = {rem_max:.6f} - {mean:.7f} = {dp:.7f}")
-        print(f"Δ− = {mean:.7f} - {rem_min:.6f} = {dm:.7f}")
-      else:
-        print("Δ+ = nan")
-        print("Δ− = nan")
-      print("-"*40)
-
-print("\nMeasurements complete.")
\ No newline at end of file
+      metric = _series_metric(b, prog)
+      for ci, cache in enumerate(CACHE_MODES):
+        cell = _cell(ci, bi, pi, fi)
+        runs = {
+          m: [results[m][k] if valid[k] else None for k in range(cell, cell + MEASUREMENTS)]
+          for m in results
+        }
+        series = runs[metric]
+        stats = _format_series(series)
+        ex_min = stats["excluded_min"]
+        ex_max = stats["excluded_max"]
+        mean = stats["mean"]
+        rem_min = stats["rem_min"]
+        rem_max = stats["rem_max"]
+        dp = stats["delta_plus"]
+        dm = stats["delta_minus"]
+        # Print the raw runs as a Python list literal
+        print(file=out)
+        print(f"wall runs: {_format_python_list(runs['wall'])}", file=out)
+        print(f"cpu runs: {_format_python_list(runs['cpu'])}", file=out)
+        print(f"user runs: {_format_python_list(runs['user'])}", file=out)
+        print(f"sys runs: {_format_python_list(runs['sys'])}", file=out)
+        print(file=out)
+        print(f"{label} ({metric}, {cache} cache):", file=out)
+        if ex_min == ex_min and ex_max == ex_max:
+          print(f"Izbačeni brojevi: min - {ex_min:.6f}s, max - {ex_max:.6f}s", file=out)
+        else:
+          print(f"Izbačeni brojevi: min - nan, max - nan", file=out)
+        if mean == mean:
+          # mean: show 7 decimals if possible
+          print(f"Aritmetička sredina: {mean:.7f}s", file=out)
+        else:
+          print("Aritmetička sredina: nan", file=out)
+        print("Maksimalne devijacije:", file=out)
+        if dp == dp and dm == dm:
+          # Show the subtraction expressions similar to sample
+          print(f"Δ+ = {rem_max:.6f} - {mean:.7f} = {dp:.7f}", file=out)
+          print(f"Δ− = {mean:.7f} - {rem_min:.6f} = {dm:.7f}", file=out)
+        else:
+          print("Δ+ = nan", file=out)
+          print("Δ− = nan", file=out)
+        print("-"*40, file=out)
+
+print("\nMeasurements complete.", file=out)
+sys.stdout.write(out.getvalue())
+sys.stdout.flush()
@@ -3,10 +3,13 @@
  *
  * Simple file copy using UNIX system calls.
  * Usage: unixcopy [-b bufsize] [-h] source_file dest_file
+ *        unixcopy --bench
  *
  * Options:
  *   -b N    set buffer size in bytes (positive integer)
  *   -h      display this help and exit
+ *   --bench run as a benchmark driver, reading copy jobs from stdin
+ *           (see bench() below)
  *
  * The program performs checks for argument errors and reports exact problems.
  */
@@ -18,15 +21,20 @@
 #include <fcntl.h>
 #include <errno.h>
 #include <string.h>
+#include <time.h>
+#include <sys/resource.h>
 #include <sys/stat.h>
+#include <sys/time.h>
 #include <sys/types.h>
 
 static void usage(const char *prog) {
   fprintf(stderr,
     "Usage: %s [-b BUF_SIZE] [-h] SOURCE_FILE DEST_FILE\n"
+    "       %s --bench\n"
     "  -b BUF_SIZE   set buffer size in bytes (positive integer)\n"
-    "  -h            show this help message and exit\n",
-    prog);
+    "  -h            show this help message and exit\n"
+    "  --bench       read SOURCE\\tDEST\\tBUF_SIZE jobs from stdin, print timings\n",
+    prog, prog);
 }
 
 static long parse_bufsize(const char *s, int *err) {
@@ -45,49 +53,9 @@ static long parse_bufsize(const char *s, int *err) {
   return v;
 }
 
-int main(int argc, char *argv[]) {
-  const char *prog = argv[0];
-  int opt;
-  long bufsize = 4096; /* default 4KB */
-  int parse_err = 0;
-
-  while ((opt = getopt(argc, argv, "b:h")) != -1) {
-    switch (opt) {
-    case 'b':
-      bufsize = parse_bufsize(optarg, &parse_err);
-      if (parse_err) {
-        fprintf(stderr, "Invalid buffer size: '%s' - must be a positive integer\n", optarg);
-        return EXIT_FAILURE;
-      }
-      break;
-    case 'h':
-      usage(prog);
-      return EXIT_SUCCESS;
-    case '?':
-    default:
-      if (optopt == 'b')
-        fprintf(stderr, "Option -%c requires an argument.\n", optopt);
-      else
-        fprintf(stderr, "Unknown option `-%c'.\n", optopt);
-      usage(prog);
-      return EXIT_FAILURE;
-    }
-  }
-
-  if (argc - optind < 2) {
-    fprintf(stderr, "Missing source and/or destination file. Expecting 2 arguments.\n");
-    usage(prog);
-    return EXIT_FAILURE;
-  }
-  if (argc - optind > 2) {
-    fprintf(stderr, "Too many arguments. Expecting exactly 2 (source and destination).\n");
-    usage(prog);
-    return EXIT_FAILURE;
-  }
-
-  const char *src_path = argv[optind];
-  const char *dst_path = argv[optind + 1];
-
+/* Copy src_path to dst_path; reports problems on stderr.
+ * Returns EXIT_SUCCESS or EXIT_FAILURE. */
+static int copy_file(const char *src_path, const char *dst_path, long bufsize) {
   /* Basic checks on source and destination */
   struct stat st_src;
   if (stat(src_path, &st_src) < 0) {
@@ -185,4 +153,102 @@ int main(int argc, char *argv[]) {
   }
 
   return EXIT_SUCCESS;
-}
\ No newline at end of file
+}
+
+static long long timeval_ns(struct timeval tv) {
+  return (long long)tv.tv_sec * 1000000000LL + (long long)tv.tv_usec * 1000LL;
+}
+
+/* Benchmark driver: read jobs "SOURCE\tDEST\tBUF_SIZE\n" from stdin, copy
+ * each one and print "START_NS END_NS USER_NS SYS_NS\n" to stdout
+ * (CLOCK_MONOTONIC_RAW around the copy and this process's CPU time spent on
+ * it), or "error\n" if the job failed. "ready\n" is
+ * printed once at start so the caller knows the mode is supported. */
+static int bench(void) {
+  char line[2 * PATH_MAX + 64];
+
+  printf("ready\n");
+  fflush(stdout);
+  while (fgets(line, sizeof line, stdin)) {
+    char *saveptr;
+    char *src_path = strtok_r(line, "\t\n", &saveptr);
+    char *dst_path = strtok_r(NULL, "\t\n", &saveptr);
+    char *buf_arg = strtok_r(NULL, "\t\n", &saveptr);
+    int parse_err = 1;
+    long bufsize = 0;
+    if (src_path && dst_path && buf_arg)
+      bufsize = parse_bufsize(buf_arg, &parse_err);
+    if (parse_err) {
+      fprintf(stderr, "Invalid benchmark job. Expecting SOURCE\\tDEST\\tBUF_SIZE.\n");
+      printf("error\n");
+      fflush(stdout);
+      continue;
+    }
+
+    struct timespec t_start, t_end;
+    struct rusage ru_start, ru_end;
+    getrusage(RUSAGE_SELF, &ru_start);
+    clock_gettime(CLOCK_MONOTONIC_RAW, &t_start);
+    int rc = copy_file(src_path, dst_path, bufsize);
+    clock_gettime(CLOCK_MONOTONIC_RAW, &t_end);
+    getrusage(RUSAGE_SELF, &ru_end);
+
+    if (rc != EXIT_SUCCESS) {
+      printf("error\n");
+    } else {
+      printf("%lld %lld %lld %lld\n",
+        (long long)t_start.tv_sec * 1000000000LL + t_start.tv_nsec,
+        (long long)t_end.tv_sec * 1000000000LL + t_end.tv_nsec,
+        timeval_ns(ru_end.ru_utime) - timeval_ns(ru_start.ru_utime),
+        timeval_ns(ru_end.ru_stime) - timeval_ns(ru_start.ru_stime));
+    }
+    fflush(stdout);
+  }
+  return EXIT_SUCCESS;
+}
+
+int main(int argc, char *argv[]) {
+  const char *prog = argv[0];
+  int opt;
+  long bufsize = 4096; /* default 4KB */
+  int parse_err = 0;
+
+  if (argc == 2 && strcmp(argv[1], "--bench") == 0)
+    return bench();
+
+  while ((opt = getopt(argc, argv, "b:h")) != -1) {
+    switch (opt) {
+    case 'b':
+      bufsize = parse_bufsize(optarg, &parse_err);
+      if (parse_err) {
+        fprintf(stderr, "Invalid buffer size: '%s' - must be a positive integer\n", optarg);
+        return EXIT_FAILURE;
+      }
+      break;
+    case 'h':
+      usage(prog);
+      return EXIT_SUCCESS;
+    case '?':
+    default:
+      if (optopt == 'b')
+        fprintf(stderr, "Option -%c requires an argument.\n", optopt);
+      else
+        fprintf(stderr, "Unknown option `-%c'.\n", optopt);
+      usage(prog);
+      return EXIT_FAILURE;
+    }
+  }
+
+  if (argc - optind < 2) {
+    fprintf(stderr, "Missing source and/or destination file. Expecting 2 arguments.\n");
+    usage(prog);
+    return EXIT_FAILURE;
+  }
+  if (argc - optind > 2) {
+    fprintf(stderr, "Too many arguments. Expecting exactly 2 (source and destination).\n");
+    usage(prog);
+    return EXIT_FAILURE;
+  }
+
+  return copy_file(argv[optind], argv[optind + 1], bufsize);
+}